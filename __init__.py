@@ -1 +1 @@
-# This file makes the src directory a Python package
+# This file makes the src directory a Python package
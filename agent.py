@@ -1,265 +1,446 @@
-"""
-Day 10: Voice Improv Battle
-A single-player improv game show with an AI host
-"""
-
-import logging
-import json
-from typing import Annotated
-from pathlib import Path
-
-from dotenv import load_dotenv
-from livekit.agents import (
-    Agent,
-    AgentSession,
-    JobContext,
-    JobProcess,
-    MetricsCollectedEvent,
-    RoomInputOptions,
-    WorkerOptions,
-    cli,
-    metrics,
-    tokenize,
-    function_tool,
-    RunContext
-)
-from livekit.plugins import silero, google, deepgram, noise_cancellation
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
-import murf_tts
-
-logger = logging.getLogger("improv_host")
-load_dotenv(".env.local")
-
-# Improv scenarios
-SCENARIOS = [
-    "You are a time-travelling tour guide explaining modern smartphones to someone from the 1800s.",
-    "You are a restaurant waiter who must calmly tell a customer that their order has escaped the kitchen.",
-    "You are a customer trying to return an obviously cursed object to a very skeptical shop owner.",
-    "You are a barista who has to tell a customer that their latte is actually a portal to another dimension.",
-    "You are a tech support agent helping an alien understand how to use a toaster.",
-    "You are a museum guide explaining why the dinosaur exhibit is currently doing yoga.",
-    "You are a pizza delivery person who accidentally delivered to the wrong century.",
-    "You are a librarian explaining to a dragon why they can't check out books without a library card."
-]
-
-# Game state storage
-game_states = {}
-
-
-class ImprovHostAgent(Agent):
-    def __init__(self, session_id: str) -> None:
-        # Initialize game state
-        if session_id not in game_states:
-            game_states[session_id] = {
-                "player_name": None,
-                "current_round": 0,
-                "max_rounds": 3,
-                "rounds": [],
-                "phase": "intro",
-                "current_scenario": None
-            }
-        
-        self.session_id = session_id
-        self.state = game_states[session_id]
-        
-        super().__init__(
-            instructions="""You are the energetic and witty host of "IMPROV BATTLE" - a TV improv game show!
-
-🎭 YOUR PERSONALITY:
-- High-energy, enthusiastic, and entertaining
-- Witty with great comedic timing
-- Honest and varied in reactions (not always supportive)
-- Sometimes amused, sometimes unimpressed, sometimes pleasantly surprised
-- Light teasing is okay, but always respectful
-- Think of yourself as a mix between a game show host and an improv coach
-
-🎯 GAME STRUCTURE:
-1. INTRO PHASE: Welcome the player, explain the game briefly
-2. SCENARIO PHASE: Present an improv scenario clearly
-3. PERFORMANCE PHASE: Let the player improvise (don't interrupt!)
-4. REACTION PHASE: Give honest, varied feedback
-5. REPEAT for 3 rounds
-6. CLOSING: Summarize their improv style and thank them
-
-📋 HOW TO RUN EACH ROUND:
-1. Call get_next_scenario() to get the scenario
-2. Present it clearly: "Alright [name], here's your scenario: [scenario]. Ready? Action!"
-3. Listen to their performance (they'll say "end scene" or "done" when finished)
-4. React honestly using varied tones:
-   - Sometimes: "That was hilarious! I loved when you..."
-   - Sometimes: "Hmm, that felt a bit rushed. You could have..."
-   - Sometimes: "Okay, interesting choice with the..."
-   - Mix positive, neutral, and constructive criticism
-5. Call record_round_reaction() with your reaction
-6. Move to next round or closing
-
-🎬 REACTION GUIDELINES:
-- Comment on specific moments from their performance
-- Vary your tone: supportive, critical, surprised, amused
-- Be honest but constructive
-- Mention what worked and what could improve
-- Keep reactions under 30 words for voice
-
-🏁 CLOSING SUMMARY:
-After 3 rounds, summarize:
-- Their improv style (character-focused? absurdist? emotional?)
-- Memorable moments
-- Overall impression
-- Thank them for playing
-
-⚡ IMPORTANT:
-- Keep responses conversational and under 30 words
-- Don't interrupt during their performance
-- Wait for "end scene" or "done" before reacting
-- Use their name occasionally
-- Be entertaining!
-
-Remember: You're hosting a show, not teaching a class. Make it fun!""",
-        )
-    
-    @function_tool
-    async def set_player_name(
-        self,
-        context: RunContext,
-        name: Annotated[str, "Player's name"]
-    ):
-        """Set the player's name at the start of the game.
-        
-        Args:
-            name: The player's name
-        """
-        self.state["player_name"] = name
-        logger.info(f"Player name set: {name}")
-        return f"Great! Welcome to Improv Battle, {name}!"
-    
-    @function_tool
-    async def get_next_scenario(self, context: RunContext):
-        """Get the next improv scenario for the current round.
-        
-        Returns the scenario text and updates game state.
-        """
-        if self.state["current_round"] >= self.state["max_rounds"]:
-            return "All rounds complete! Time for the closing summary."
-        
-        scenario = SCENARIOS[self.state["current_round"] % len(SCENARIOS)]
-        self.state["current_scenario"] = scenario
-        self.state["phase"] = "awaiting_improv"
-        
-        logger.info(f"Round {self.state['current_round'] + 1}: {scenario}")
-        return scenario
-    
-    @function_tool
-    async def record_round_reaction(
-        self,
-        context: RunContext,
-        reaction: Annotated[str, "Host's reaction to the player's performance"]
-    ):
-        """Record the host's reaction after a player's improv performance.
-        
-        Args:
-            reaction: The host's feedback/reaction
-        """
-        self.state["rounds"].append({
-            "scenario": self.state["current_scenario"],
-            "host_reaction": reaction
-        })
-        
-        self.state["current_round"] += 1
-        self.state["phase"] = "intro" if self.state["current_round"] < self.state["max_rounds"] else "done"
-        
-        logger.info(f"Round {self.state['current_round']} complete. Reaction: {reaction}")
-        
-        if self.state["current_round"] >= self.state["max_rounds"]:
-            return "All rounds complete! Give your closing summary now."
-        
-        return f"Round {self.state['current_round']} of {self.state['max_rounds']} complete. Ready for the next scenario!"
-    
-    @function_tool
-    async def get_game_status(self, context: RunContext):
-        """Get current game status and state.
-        
-        Returns information about current round, phase, and progress.
-        """
-        status = {
-            "player": self.state["player_name"],
-            "round": f"{self.state['current_round']}/{self.state['max_rounds']}",
-            "phase": self.state["phase"],
-            "rounds_completed": len(self.state["rounds"])
-        }
-        
-        return json.dumps(status)
-    
-    @function_tool
-    async def end_game(self, context: RunContext):
-        """End the game early if player wants to stop.
-        
-        Gracefully closes the improv battle.
-        """
-        self.state["phase"] = "done"
-        logger.info("Game ended early by player")
-        return "Thanks for playing Improv Battle! You were great!"
-
-
-def prewarm(proc: JobProcess):
-    """Prewarm the VAD model"""
-    proc.userdata["vad"] = silero.VAD.load()
-
-
-async def entrypoint(ctx: JobContext):
-    """Main entrypoint for the Improv Host agent"""
-    
-    session_id = ctx.room.name
-    logger.info(f"Starting Improv Battle for room: {session_id}")
-    
-    # Create session with Murf TTS
-    session = AgentSession(
-        stt=deepgram.STT(
-            model="nova-3",
-            language="en-US",
-        ),
-        llm=google.LLM(
-            model="gemini-2.0-flash-001",
-            temperature=0.8,  # Higher for creative, varied responses
-        ),
-        tts=murf_tts.TTS(
-            voice="en-US-ryan",
-            style="Conversational",
-            tokenizer=tokenize.basic.SentenceTokenizer(
-                min_sentence_len=20,
-            ),
-        ),
-        turn_detection=MultilingualModel(),
-        vad=ctx.proc.userdata["vad"],
-    )
-    
-    # Metrics collection
-    usage_collector = metrics.UsageCollector()
-
-    @session.on("metrics_collected")
-    def _on_metrics_collected(ev: MetricsCollectedEvent):
-        metrics.log_metrics(ev.metrics)
-        usage_collector.collect(ev.metrics)
-
-    async def log_usage():
-        summary = usage_collector.get_summary()
-        logger.info(f"Usage: {summary}")
-
-    ctx.add_shutdown_callback(log_usage)
-
-    # Start the session with Improv Host
-    host = ImprovHostAgent(session_id)
-    
-    await session.start(
-        agent=host,
-        room=ctx.room,
-        room_input_options=RoomInputOptions(
-            noise_cancellation=noise_cancellation.BVC(),
-        ),
-    )
-
-    # Join the room
-    await ctx.connect()
-
-
-if __name__ == "__main__":
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
+"""
+Day 10: Voice Improv Battle
+A single-player improv game show with an AI host
+"""
+
+import asyncio
+import logging
+import os
+import random
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Annotated, Final, Optional
+from pathlib import Path
+
+from dotenv import load_dotenv
+from livekit.agents import (
+    Agent,
+    AgentSession,
+    JobContext,
+    JobProcess,
+    MetricsCollectedEvent,
+    RoomInputOptions,
+    WorkerOptions,
+    cli,
+    metrics,
+    tokenize,
+    tts,
+    function_tool,
+    RunContext
+)
+from livekit.agents.tokenize import token_stream
+from livekit.plugins import silero, google, deepgram, noise_cancellation
+from livekit.plugins.turn_detector.english import EnglishModel
+import murf_tts
+
+try:
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass  # optional; fall back to the default asyncio loop
+
+logger = logging.getLogger("improv_host")
+load_dotenv(".env.local")
+
+# Improv scenarios
+SCENARIOS = [
+    "You are a time-travelling tour guide explaining modern smartphones to someone from the 1800s.",
+    "You are a restaurant waiter who must calmly tell a customer that their order has escaped the kitchen.",
+    "You are a customer trying to return an obviously cursed object to a very skeptical shop owner.",
+    "You are a barista who has to tell a customer that their latte is actually a portal to another dimension.",
+    "You are a tech support agent helping an alien understand how to use a toaster.",
+    "You are a museum guide explaining why the dinosaur exhibit is currently doing yoga.",
+    "You are a pizza delivery person who accidentally delivered to the wrong century.",
+    "You are a librarian explaining to a dragon why they can't check out books without a library card."
+]
+
+
+@dataclass
+class GameState:
+    """Per-session game state, owned by the agent instance."""
+    player_name: Optional[str] = None
+    current_round: int = 0
+    max_rounds: int = 3
+    rounds: list = field(default_factory=list)
+    phase: str = "intro"
+    current_scenario: Optional[str] = None
+    scenario_queue: list = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        # One shuffled draw up front; no repeats within a session
+        self.scenario_queue = random.sample(range(len(SCENARIOS)), k=self.max_rounds)
+
+
+# Host prompt, built once at import time so session startup doesn't re-evaluate it
+_HOST_INSTRUCTIONS: Final[str] = """You are the energetic and witty host of "IMPROV BATTLE" - a TV improv game show!
+
+🎭 YOUR PERSONALITY:
+- High-energy, enthusiastic, and entertaining
+- Witty with great comedic timing
+- Honest and varied in reactions (not always supportive)
+- Sometimes amused, sometimes unimpressed, sometimes pleasantly surprised
+- Light teasing is okay, but always respectful
+- Think of yourself as a mix between a game show host and an improv coach
+
+🎯 GAME STRUCTURE:
+1. INTRO PHASE: Welcome the player, explain the game briefly
+2. SCENARIO PHASE: Present an improv scenario clearly
+3. PERFORMANCE PHASE: Let the player improvise (don't interrupt!)
+4. REACTION PHASE: Give honest, varied feedback
+5. REPEAT for 3 rounds
+6. CLOSING: Summarize their improv style and thank them
+
+📋 HOW TO RUN EACH ROUND:
+1. Call get_next_scenario() to get the scenario
+2. Present it clearly: "Alright [name], here's your scenario: [scenario]. Ready? Action!"
+3. Listen to their performance (they'll say "end scene" or "done" when finished)
+4. React honestly using varied tones:
+   - Sometimes: "That was hilarious! I loved when you..."
+   - Sometimes: "Hmm, that felt a bit rushed. You could have..."
+   - Sometimes: "Okay, interesting choice with the..."
+   - Mix positive, neutral, and constructive criticism
+5. Call record_round_reaction() with your reaction
+6. Move to next round or closing
+
+🎬 REACTION GUIDELINES:
+- Comment on specific moments from their performance
+- Vary your tone: supportive, critical, surprised, amused
+- Be honest but constructive
+- Mention what worked and what could improve
+- Keep reactions under 30 words for voice
+
+🏁 CLOSING SUMMARY:
+After 3 rounds, call get_closing_summary() and deliver the prepared text
+(lightly adapted is fine). It covers:
+- Their improv style (character-focused? absurdist? emotional?)
+- Memorable moments
+- Overall impression
+- Thank them for playing
+
+⚡ IMPORTANT:
+- Keep responses conversational and under 30 words
+- Don't interrupt during their performance
+- Wait for "end scene" or "done" before reacting
+- Use their name occasionally
+- Be entertaining!
+
+🔧 TOOL RESULTS:
+Tools reply with terse signals, not lines to read aloud:
+- "OK" = the action succeeded; just continue with your next line
+- "NEXT" = round recorded; move straight to the next scenario
+- "END" = the game is over; call get_closing_summary() and deliver it
+Never repeat or paraphrase these tokens to the player.
+
+Remember: You're hosting a show, not teaching a class. Make it fun!"""
+
+# Prompt for the pre-generated closing summary, issued as a hidden LLM call
+# while the final reaction is still being spoken
+_CLOSING_PROMPT: Final[str] = (
+    "The game is over. Write your closing summary now: the player's improv "
+    "style, one memorable moment, and a thank-you. Keep it under 40 words "
+    "so it fits the response budget, and stay in character as the host."
+)
+
+
+class ImprovHostAgent(Agent):
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self.state = GameState()
+        self._closing_summary_task: Optional[asyncio.Task] = None
+
+        super().__init__(instructions=_HOST_INSTRUCTIONS)
+
+    @function_tool
+    async def set_player_name(
+        self,
+        context: RunContext,
+        name: Annotated[str, "Player's name"]
+    ):
+        """Set the player's name at the start of the game.
+        
+        Args:
+            name: The player's name
+        """
+        self.state.player_name = name
+        logger.info("Player name set: %s", name)
+        return "OK"
+    
+    @function_tool
+    async def get_next_scenario(self, context: RunContext):
+        """Get the next improv scenario for the current round.
+        
+        Returns the scenario text and updates game state.
+        """
+        if self.state.current_round >= self.state.max_rounds:
+            return "All rounds complete! Time for the closing summary."
+        
+        scenario = SCENARIOS[self.state.scenario_queue[self.state.current_round]]
+        self.state.current_scenario = scenario
+        self.state.phase = "awaiting_improv"
+        
+        logger.info("Round %d: %s", self.state.current_round + 1, scenario)
+        return scenario
+    
+    @function_tool
+    async def record_round_reaction(
+        self,
+        context: RunContext,
+        reaction: Annotated[str, "Host's reaction to the player's performance"]
+    ):
+        """Record the host's reaction after a player's improv performance.
+        
+        Args:
+            reaction: The host's feedback/reaction
+        """
+        self.state.rounds.append({
+            "scenario": self.state.current_scenario,
+            "host_reaction": reaction
+        })
+        
+        self.state.current_round += 1
+        self.state.phase = "intro" if self.state.current_round < self.state.max_rounds else "done"
+        
+        logger.info("Round %d complete. Reaction: %s", self.state.current_round, reaction)
+        
+        if self.state.current_round >= self.state.max_rounds:
+            # Kick off the closing summary now so it's ready by the time the
+            # model asks for it; overlaps the two Gemini round trips. Guard
+            # against a repeated final call clobbering a task already in flight.
+            if self._closing_summary_task is None:
+                self._closing_summary_task = asyncio.create_task(
+                    self._prewarm_closing_summary()
+                )
+                self._closing_summary_task.add_done_callback(
+                    self._on_closing_summary_done
+                )
+            return "END"
+        
+        return "NEXT"
+    
+    @function_tool
+    async def get_game_status(self, context: RunContext):
+        """Get current game status and state.
+        
+        Returns information about current round, phase, and progress.
+        """
+        return (
+            f"Player: {self.state.player_name}. "
+            f"Round {self.state.current_round} of {self.state.max_rounds}, "
+            f"phase: {self.state.phase}, "
+            f"rounds completed: {len(self.state.rounds)}."
+        )
+    
+    def _on_closing_summary_done(self, task: "asyncio.Task") -> None:
+        # Observe the result even if get_closing_summary is never called
+        # (player disconnects after round 3), so a failed hidden LLM call
+        # doesn't surface as "Task exception was never retrieved" at GC
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Closing summary prewarm failed: %s", exc)
+
+    async def cancel_closing_summary(self) -> None:
+        """Cancel an in-flight closing-summary call (called on shutdown)."""
+        task = self._closing_summary_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _prewarm_closing_summary(self) -> str:
+        """Generate the closing summary via a hidden LLM call and cache it."""
+        chat_ctx = self.chat_ctx.copy()
+        chat_ctx.add_message(role="user", content=_CLOSING_PROMPT)
+
+        parts = []
+        async with self.session.llm.chat(chat_ctx=chat_ctx) as stream:
+            async for chunk in stream:
+                if chunk.delta and chunk.delta.content:
+                    parts.append(chunk.delta.content)
+        return "".join(parts)
+
+    @function_tool
+    async def get_closing_summary(self, context: RunContext):
+        """Get the prepared closing summary after the final round.
+        
+        Returns the summary text to deliver to the player.
+        """
+        task = self._closing_summary_task
+        if task is not None and not task.cancelled():
+            try:
+                return await task
+            except Exception:
+                pass  # already logged by the done callback
+        return "Improvise your own closing summary now."
+
+    @function_tool
+    async def end_game(self, context: RunContext):
+        """End the game early if player wants to stop.
+        
+        Gracefully closes the improv battle.
+        """
+        self.state.phase = "done"
+        logger.info("Game ended early by player")
+        return "END"
+
+
+# Sentence boundary pattern, compiled once at import
+_SENTENCE_RE = re.compile(r"[^.?!]+[.?!]+|[^.?!]+$")
+
+
+class RegexSentenceTokenizer(tokenize.basic.SentenceTokenizer):
+    """Sentence splitter backed by a precompiled regex.
+
+    The basic tokenizer scans text in Python; re.finditer does the same
+    boundary scan in C, which adds up for the short host lines flushed to
+    TTS on every sentence.
+    """
+
+    def __init__(self, *, min_sentence_len: int = 20) -> None:
+        super().__init__(min_sentence_len=min_sentence_len)
+        self._min_sentence_len = min_sentence_len
+
+    def _split(self, text: str) -> list:
+        """Split text into (sentence, start, end) tuples, folding fragments
+        shorter than the minimum into the previous sentence so tiny chunks
+        don't reach TTS on their own."""
+        tokens = []
+        for m in _SENTENCE_RE.finditer(text):
+            tok = m.group().strip()
+            if not tok:
+                continue
+            if tokens and len(tokens[-1][0]) < self._min_sentence_len:
+                prev, start, _ = tokens[-1]
+                tokens[-1] = (f"{prev} {tok}", start, m.end())
+            else:
+                tokens.append((tok, m.start(), m.end()))
+        return tokens
+
+    def tokenize(self, text: str, *, language: Optional[str] = None) -> list:
+        sentences = [tok[0] for tok in self._split(text)]
+        return sentences if sentences else [text]
+
+    # quoted annotation: the tokenize() method above shadows the module here
+    def stream(self, *, language: Optional[str] = None) -> "tokenize.SentenceStream":
+        # The inherited stream() is hard-wired to the basic splitter via
+        # functools.partial and never dispatches to tokenize(); the TTS
+        # StreamAdapter only consumes the tokenizer through stream(), so the
+        # regex path has to be plugged in here
+        return token_stream.BufferedSentenceStream(
+            tokenizer=self._split,
+            min_token_len=self._min_sentence_len,
+            min_ctx_len=10,
+        )
+
+
+def prewarm(proc: JobProcess):
+    """Prewarm the VAD model and the STT/LLM/TTS clients.
+
+    Building the clients here keeps TCP/TLS setup and model warm-up off the
+    per-job hot path; every session in this worker process reuses them.
+    """
+    proc.userdata["vad"] = silero.VAD.load()
+    # STT is pinned to en-US, so the lighter English-only detector suffices
+    proc.userdata["turn_detector"] = EnglishModel()
+    proc.userdata["stt"] = deepgram.STT(
+        model="nova-3",
+        language="en-US",
+        smart_format=True,  # Interim results, 25ms endpointing, etc. are already default
+    )
+    # BVC loads a native DSP model; build it once per process, or skip it
+    # entirely on low-CPU workers via DISABLE_NOISE_CANCELLATION=1
+    if os.environ.get("DISABLE_NOISE_CANCELLATION", "").lower() in ("1", "true"):
+        proc.userdata["bvc"] = None
+    else:
+        proc.userdata["bvc"] = noise_cancellation.BVC()
+    proc.userdata["llm"] = google.LLM(
+        model="gemini-2.0-flash-001",
+        temperature=0.8,  # Higher for creative, varied responses
+        top_p=0.9,
+        max_output_tokens=80,  # Enforce the ~30-word rule at the API level
+        location="us-central1",  # Pin the region when routed through Vertex AI
+    )
+    # Murf synthesizes whole chunks, so adapt it to a streaming interface:
+    # each sentence is flushed to Murf as the LLM emits it, letting playback
+    # begin on the first sentence instead of waiting for the full response.
+    proc.userdata["tts"] = tts.StreamAdapter(
+        tts=murf_tts.TTS(
+            voice="en-US-ryan",
+            style="Conversational",
+        ),
+        sentence_tokenizer=RegexSentenceTokenizer(
+            min_sentence_len=20,
+        ),
+    )
+
+
+async def entrypoint(ctx: JobContext):
+    """Main entrypoint for the Improv Host agent"""
+    
+    session_id = ctx.room.name
+    logger.info("Starting Improv Battle for room: %s", session_id)
+    
+    # Create session with the prewarmed Murf TTS and other shared clients
+    session = AgentSession(
+        stt=ctx.proc.userdata["stt"],
+        llm=ctx.proc.userdata["llm"],
+        tts=ctx.proc.userdata["tts"],
+        turn_detection=ctx.proc.userdata["turn_detector"],
+        vad=ctx.proc.userdata["vad"],
+    )
+    
+    # Metrics collection: buffer events and log them off the hot path so the
+    # handler doesn't do formatting/I/O on the loop between audio frames
+    usage_collector = metrics.UsageCollector()
+    metrics_buf = deque()
+
+    @session.on("metrics_collected")
+    def _on_metrics_collected(ev: MetricsCollectedEvent):
+        metrics_buf.append(ev.metrics)
+        usage_collector.collect(ev.metrics)
+
+    def _drain_metrics():
+        while metrics_buf:
+            metrics.log_metrics(metrics_buf.popleft())
+
+    async def _flush_metrics_loop():
+        while True:
+            await asyncio.sleep(5)
+            _drain_metrics()
+
+    flush_task = asyncio.create_task(_flush_metrics_loop())
+
+    async def log_usage():
+        flush_task.cancel()
+        _drain_metrics()
+        summary = usage_collector.get_summary()
+        logger.info("Usage: %s", summary)
+
+    ctx.add_shutdown_callback(log_usage)
+
+    # Start the session with Improv Host
+    host = ImprovHostAgent(session_id)
+
+    ctx.add_shutdown_callback(host.cancel_closing_summary)
+    
+    # Session bootstrap and room join are independent network operations;
+    # overlap them instead of paying one RTT after the other
+    await asyncio.gather(
+        session.start(
+            agent=host,
+            room=ctx.room,
+            room_input_options=RoomInputOptions(
+                noise_cancellation=ctx.proc.userdata["bvc"],
+            ),
+        ),
+        ctx.connect(),
+    )
+
+
+if __name__ == "__main__":
+    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint, prewarm_fnc=prewarm))
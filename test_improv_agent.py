@@ -0,0 +1,154 @@
+import pytest
+from livekit.agents import AgentSession, inference, llm
+
+from agent import SCENARIOS, ImprovHostAgent
+
+
+def _llm() -> llm.LLM:
+    return inference.LLM(model="openai/gpt-4.1-mini")
+
+
+@pytest.mark.asyncio
+async def test_set_player_name_signal_is_not_spoken() -> None:
+    """The "OK" tool signal must update state silently, never be read aloud."""
+    async with (
+        _llm() as llm,
+        AgentSession(llm=llm) as session,
+    ):
+        host = ImprovHostAgent("test-room")
+        await session.start(host)
+
+        result = await session.run(user_input="Hi, I'm Sam and I'm ready to play!")
+
+        # The host may greet before registering the name
+        result.expect.skip_next_event_if(type="message", role="assistant")
+
+        result.expect.next_event().is_function_call(
+            name="set_player_name", arguments={"name": "Sam"}
+        )
+        result.expect.next_event().is_function_call_output(output="OK")
+
+        # Evaluate the follow-up line for the welcome, without the raw token
+        await (
+            result.expect.next_event()
+            .is_message(role="assistant")
+            .judge(
+                llm,
+                intent="""
+                Welcomes Sam to the game in the voice of an improv game show host.
+
+                The response must not:
+                - Contain the bare token "OK" as if reading out a tool result
+
+                The response may include an explanation of the rules or an
+                invitation to start the first round.
+                """,
+            )
+        )
+
+        assert host.state.player_name == "Sam"
+
+
+@pytest.mark.asyncio
+async def test_round_reaction_returns_next_signal() -> None:
+    """Mid-game, recording a reaction advances the round via the NEXT signal."""
+    async with (
+        _llm() as llm,
+        AgentSession(llm=llm) as session,
+    ):
+        host = ImprovHostAgent("test-room")
+        await session.start(host)
+
+        # Fast-forward into round 1 of 3, mid-performance
+        host.state.player_name = "Sam"
+        host.state.current_round = 0
+        host.state.current_scenario = SCENARIOS[0]
+        host.state.phase = "awaiting_improv"
+
+        result = await session.run(
+            user_input=(
+                "...and that, dear time traveller, is why we stare at the "
+                "glowing rectangle all day. End scene!"
+            )
+        )
+
+        result.expect.skip_next_event_if(type="message", role="assistant")
+        result.expect.next_event().is_function_call(name="record_round_reaction")
+        result.expect.next_event().is_function_call_output(output="NEXT")
+
+        # Evaluate the host's spoken reaction
+        await (
+            result.expect.next_event()
+            .is_message(role="assistant")
+            .judge(
+                llm,
+                intent="""
+                Reacts to the player's improv performance as a game show host.
+
+                The response must not:
+                - Contain the bare token "NEXT" as if reading out a tool result
+                """,
+            )
+        )
+
+        assert host.state.current_round == 1
+        assert len(host.state.rounds) == 1
+        assert host.state.rounds[0]["scenario"] == SCENARIOS[0]
+
+
+@pytest.mark.asyncio
+async def test_final_round_prepares_closing_summary() -> None:
+    """The last reaction returns END, prewarms the summary, and the host
+    delivers a closing via get_closing_summary."""
+    async with (
+        _llm() as llm,
+        AgentSession(llm=llm) as session,
+    ):
+        host = ImprovHostAgent("test-room")
+        await session.start(host)
+
+        # Fast-forward to the final round, mid-performance
+        host.state.player_name = "Sam"
+        host.state.current_round = 2
+        host.state.current_scenario = SCENARIOS[1]
+        host.state.phase = "awaiting_improv"
+        host.state.rounds = [
+            {"scenario": SCENARIOS[0], "host_reaction": "Loved the commitment!"},
+            {"scenario": SCENARIOS[2], "host_reaction": "A bit rushed, but fun."},
+        ]
+
+        result = await session.run(
+            user_input=(
+                "Sir, I'm afraid your lasagna has left the building. "
+                "It was last seen heading for the border. End scene!"
+            )
+        )
+
+        result.expect.skip_next_event_if(type="message", role="assistant")
+        result.expect.next_event().is_function_call(name="record_round_reaction")
+        result.expect.next_event().is_function_call_output(output="END")
+
+        # The hidden closing-summary call must have been kicked off and must
+        # produce actual text (a dead task would fall back to improvising)
+        assert host._closing_summary_task is not None
+        summary = await host._closing_summary_task
+        assert summary.strip()
+
+        # Evaluate the rest of the turn for a delivered closing summary
+        await (
+            result.expect.next_event(type="message")
+            .is_message(role="assistant")
+            .judge(
+                llm,
+                intent="""
+                Wraps up the game show with a closing for Sam.
+
+                The response may cover their improv style, a memorable moment,
+                and a thank-you, or hand off to the prepared summary. It must
+                not contain the bare token "END".
+                """,
+            )
+        )
+
+        assert host.state.phase == "done"
+        assert host.state.current_round == 3